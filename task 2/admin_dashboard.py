@@ -59,11 +59,11 @@ st.markdown(
 
 
 @st.cache_data(ttl=1) 
-def load_data():
-    """Loads and preprocesses the feedback data from Google Sheets."""
+def load_data(start_date=None):
+    """Loads and preprocesses the feedback data from Google Sheets (and the archive, if start_date is set)."""
     
     # Load data from Google Sheets via data handler
-    df = load_all_submissions()
+    df = load_all_submissions(start_date=start_date)
 
     if df.empty:
         print("DEBUG: DataFrame is empty")
@@ -117,7 +117,13 @@ st.title("Admin Dashboard")
 st.markdown("Monitor and analyze user feedback with AI-powered insights.")
 st.markdown("---")
 
-df_data = load_data()
+# Old submissions live in local Parquet files and are only read when an earlier start date is picked
+history_start = st.date_input(
+    "Show submissions since (includes archived history)",
+    value=None
+)
+
+df_data = load_data(history_start)
 
 if df_data.empty:
     st.info("No feedback submissions have been recorded yet.")
@@ -0,0 +1,24 @@
+import argparse
+import sys
+
+from core.data_handler import archive_old_submissions, ARCHIVE_HORIZON_DAYS
+
+
+# Moves old rows out of the Submissions worksheet into local Parquet partitions.
+# Run periodically (e.g. from cron): python archive_submissions.py --days 90
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive old feedback submissions from Google Sheets.")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=ARCHIVE_HORIZON_DAYS,
+        help=f"Archive submissions older than this many days (default: {ARCHIVE_HORIZON_DAYS})"
+    )
+    args = parser.parse_args()
+
+    try:
+        archived = archive_old_submissions(args.days)
+    except Exception as e:
+        print(f"ERROR: Archiving failed: {type(e).__name__}: {e}")
+        sys.exit(1)
+    print(f"Archived {archived} submissions")
@@ -2,9 +2,10 @@
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import json
+import glob
 import gspread
 from google.oauth2.service_account import Credentials
 
@@ -18,6 +19,25 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive"
 ]
 
+# Column order of the Submissions worksheet
+SUBMISSION_COLUMNS = [
+    "timestamp",
+    "user_rating",
+    "user_review",
+    "ai_user_response",
+    "ai_summary",
+    "ai_actions"
+]
+
+# Local archive for submissions trimmed from the sheet.
+# Partitions are laid out as <ARCHIVE_DIR>/date=YYYY-MM-DD/user_rating=N/submissions.parquet
+# Relative paths are resolved against the app directory, so the CLI job and the
+# dashboard use the same location regardless of their working directory.
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARCHIVE_DIR = os.path.join(APP_DIR, os.environ.get("SUBMISSIONS_ARCHIVE_DIR", "archive"))
+ARCHIVE_FILE_NAME = "submissions.parquet"
+ARCHIVE_HORIZON_DAYS = int(os.environ.get("SUBMISSIONS_ARCHIVE_HORIZON_DAYS", "90"))
+
 @st.cache_resource
 def get_sheet():
     """
@@ -108,15 +128,7 @@ def initialize_data_file():
         
         
         if len(all_values) == 0:
-            headers = [
-                "timestamp",
-                "user_rating",
-                "user_review",
-                "ai_user_response",
-                "ai_summary",
-                "ai_actions"
-            ]
-            sheet.append_row(headers)
+            sheet.append_row(SUBMISSION_COLUMNS)
             print(f"Initialized Google Sheet '{SHEET_TITLE}' with headers")
     except Exception as e:
         print(f"Error initializing Google Sheet: {e}")
@@ -153,36 +165,241 @@ def save_submission(data: dict):
         st.error(error_msg)
 
 
-def load_all_submissions():
+def _read_sheet_submissions(sheet):
+    """
+    Reads every record from the worksheet into a DataFrame with the expected columns.
+    """
+    records = sheet.get_all_records()
+    if len(records) == 0:
+        return pd.DataFrame(columns=SUBMISSION_COLUMNS)
+    return pd.DataFrame(records)
+
+
+def _parse_timestamps(timestamps):
+    """
+    Parses ISO timestamps, which may or may not carry a fractional part.
+    Unreadable values become NaT.
+    """
+    return pd.to_datetime(timestamps, errors="coerce", format="ISO8601")
+
+
+def _as_date(value):
+    """
+    Normalises a date, datetime or date string bound to a datetime.date (None stays None).
+    """
+    if value is None:
+        return None
+    return pd.Timestamp(value).date()
+
+
+def _filter_submissions(df, start_date=None, end_date=None, min_rating=None):
+    """
+    Keeps only rows whose timestamp date lies in [start_date, end_date]
+    and whose rating is at least min_rating. Unset bounds are ignored.
+    """
+    if df.empty:
+        return df
+
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    if start_date is not None or end_date is not None:
+        dates = _parse_timestamps(df["timestamp"]).dt.date
+        mask = dates.notna()
+        if start_date is not None:
+            mask &= dates >= start_date
+        if end_date is not None:
+            mask &= dates <= end_date
+        df = df[mask]
+
+    if min_rating is not None:
+        ratings = pd.to_numeric(df["user_rating"], errors="coerce")
+        df = df[ratings >= min_rating]
+
+    return df
+
+
+def _archive_date_dirs():
+    """
+    Returns (partition_date, directory) pairs for every date partition in the archive, oldest first.
+    """
+    partitions = []
+    for date_dir in glob.glob(os.path.join(ARCHIVE_DIR, "date=*")):
+        try:
+            partition_date = datetime.strptime(
+                os.path.basename(date_dir).split("=", 1)[1], "%Y-%m-%d"
+            ).date()
+        except ValueError:
+            continue
+        partitions.append((partition_date, date_dir))
+    return sorted(partitions)
+
+
+def _archive_partitions(start_date=None, end_date=None, min_rating=None):
+    """
+    Lists archive Parquet files, pruning partitions by their date and rating
+    directory names so files outside the requested range are never opened.
+    """
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    paths = []
+    for partition_date, date_dir in _archive_date_dirs():
+        if start_date is not None and partition_date < start_date:
+            continue
+        if end_date is not None and partition_date > end_date:
+            continue
+
+        for rating_dir in sorted(glob.glob(os.path.join(date_dir, "user_rating=*"))):
+            try:
+                partition_rating = int(os.path.basename(rating_dir).split("=", 1)[1])
+            except ValueError:
+                continue
+            if min_rating is not None and partition_rating < min_rating:
+                continue
+            paths.extend(sorted(glob.glob(os.path.join(rating_dir, "*.parquet"))))
+    return paths
+
+
+def _needs_archive(start_date=None, end_date=None):
+    """
+    Decides whether a requested date range reaches into the archive.
+    With no bounds only the live sheet is read; otherwise the archive is read
+    when the range starts on or before the newest archived partition.
+    """
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    if start_date is None and end_date is None:
+        return False
+
+    partitions = _archive_date_dirs()
+    if len(partitions) == 0:
+        return False
+    newest_archived = partitions[-1][0]
+    return start_date is None or start_date <= newest_archived
+
+
+def load_archived_submissions(start_date=None, end_date=None, min_rating=None):
+    """
+    Loads archived submissions from the local Parquet partitions.
+    Returns a pandas DataFrame with the same columns as the live sheet.
+    """
+    paths = _archive_partitions(start_date, end_date, min_rating)
+    if len(paths) == 0:
+        return pd.DataFrame(columns=SUBMISSION_COLUMNS)
+
+    df = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+    df = df.drop_duplicates(subset="timestamp", keep="last")
+    return _filter_submissions(df, start_date, end_date, min_rating)
+
+
+def _write_partition(partition_dir, part):
+    """
+    Merges rows into the partition's single Parquet file, de-duplicating on timestamp
+    so that re-archiving rows left behind by an interrupted run is harmless.
     """
-    Loads all submission data from the Google Sheet for the Admin Dashboard.
+    os.makedirs(partition_dir, exist_ok=True)
+    path = os.path.join(partition_dir, ARCHIVE_FILE_NAME)
+    if os.path.exists(path):
+        part = pd.concat([pd.read_parquet(path), part], ignore_index=True)
+    part = part.drop_duplicates(subset="timestamp", keep="last")
+
+    # Write to a temporary file first so a crash never leaves a half-written partition
+    tmp_path = path + ".tmp"
+    part.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def archive_old_submissions(horizon_days: int = ARCHIVE_HORIZON_DAYS):
+    """
+    Moves submissions older than horizon_days from the Google Sheet into
+    date/rating partitioned Parquet files under ARCHIVE_DIR, then deletes
+    those rows from the sheet. Returns the number of rows deleted from the sheet.
+    Errors are raised so that the calling job can report failure; the job is
+    safe to re-run after a failure.
+    """
+    sheet = get_sheet()
+    if sheet is None:
+        raise RuntimeError("Could not connect to Google Sheets")
+
+    all_values = sheet.get_all_values()
+    if len(all_values) <= 1:
+        print("No submissions to archive")
+        return 0
+
+    header, rows = all_values[0], all_values[1:]
+    df = pd.DataFrame(rows, columns=header)
+    # Sheet row numbers are 1-based and row 1 holds the headers
+    df["_sheet_row"] = range(2, len(rows) + 2)
+
+    cutoff = (datetime.now() - timedelta(days=horizon_days)).date()
+    dates = _parse_timestamps(df["timestamp"]).dt.date
+    ratings = pd.to_numeric(df["user_rating"], errors="coerce")
+    # Rows with an unreadable timestamp or rating stay in the sheet
+    old = df[dates.notna() & ratings.notna() & (dates < cutoff)].copy()
+    if old.empty:
+        print(f"No submissions older than {horizon_days} days to archive")
+        return 0
+
+    old["user_rating"] = ratings[old.index].astype(int)
+    old_dates = dates[old.index]
+
+    # Write every partition before touching the sheet, so a failed write never loses rows
+    for (partition_date, rating), part in old.groupby([old_dates, "user_rating"]):
+        partition_dir = os.path.join(
+            ARCHIVE_DIR,
+            f"date={partition_date.isoformat()}",
+            f"user_rating={rating}"
+        )
+        _write_partition(partition_dir, part[SUBMISSION_COLUMNS])
+
+    # Group rows into contiguous (start, end) runs, deleted bottom-up so earlier row numbers stay valid
+    runs = []
+    for row in sorted(old["_sheet_row"], reverse=True):
+        if runs and row == runs[-1][0] - 1:
+            runs[-1][0] = row
+        else:
+            runs.append([row, row])
+
+    deleted = 0
+    try:
+        for run_start, run_end in runs:
+            sheet.delete_rows(run_start, run_end)
+            deleted += run_end - run_start + 1
+    except Exception as e:
+        print(
+            f"ERROR: Deleted {deleted} of {len(old)} archived submissions from Google Sheets "
+            f"before failing: {e}. Re-run the job to finish trimming the sheet."
+        )
+        raise
+
+    print(f"✓ Archived {deleted} submissions older than {cutoff} to '{ARCHIVE_DIR}'")
+    return deleted
+
+
+def load_all_submissions(start_date=None, end_date=None, min_rating=None):
+    """
+    Loads submission data for the Admin Dashboard.
+    Only the live Google Sheet is read unless the requested date range reaches
+    into the archive, in which case matching archive partitions are combined
+    with the sheet into one frame. Bounds may be dates, datetimes or ISO strings.
     Returns a pandas DataFrame.
     """
     try:
         sheet = get_sheet()
         if sheet is None:
             return pd.DataFrame()
-        
-        # Get all records as a list of dictionaries
-        records = sheet.get_all_records()
-        
-        # Convert to DataFrame
-        if len(records) == 0:
-            # Return empty DataFrame with expected columns if no data
-            return pd.DataFrame(columns=[
-                "timestamp",
-                "user_rating",
-                "user_review",
-                "ai_user_response",
-                "ai_summary",
-                "ai_actions"
-            ])
-        
-        df = pd.DataFrame(records)
-        print(f"✓ Successfully loaded {len(df)} submissions from Google Sheets")
+
+        df = _filter_submissions(
+            _read_sheet_submissions(sheet), start_date, end_date, min_rating
+        )
+
+        if _needs_archive(start_date, end_date):
+            archived = load_archived_submissions(start_date, end_date, min_rating)
+            if not archived.empty:
+                # Rows archived by an interrupted job may still be in the sheet
+                df = pd.concat([archived, df], ignore_index=True)
+                df = df.drop_duplicates(subset="timestamp", keep="last").reset_index(drop=True)
+                print(f"✓ Loaded {len(archived)} archived submissions from '{ARCHIVE_DIR}'")
+
+        print(f"✓ Successfully loaded {len(df)} submissions")
         return df
-        
+
     except Exception as e:
         print(f"Error loading data from Google Sheets: {e}")
         return pd.DataFrame()
-
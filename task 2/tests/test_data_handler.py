@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import core.data_handler as data_handler
+from core.data_handler import SUBMISSION_COLUMNS
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a gspread worksheet."""
+
+    def __init__(self, rows, fail_on_delete_call=None):
+        self.values = [list(SUBMISSION_COLUMNS)] + rows
+        self.delete_calls = []
+        self.fail_on_delete_call = fail_on_delete_call
+
+    def get_all_values(self):
+        return [list(row) for row in self.values]
+
+    def get_all_records(self):
+        records = []
+        for row in self.values[1:]:
+            record = dict(zip(SUBMISSION_COLUMNS, row))
+            record["user_rating"] = int(record["user_rating"])
+            records.append(record)
+        return records
+
+    def delete_rows(self, start_index, end_index):
+        self.delete_calls.append((start_index, end_index))
+        if len(self.delete_calls) == self.fail_on_delete_call:
+            raise RuntimeError("APIError: [429] Quota exceeded")
+        del self.values[start_index - 1:end_index]
+
+
+def submission(days_ago, rating, review, microsecond=123456):
+    timestamp = (datetime.now() - timedelta(days=days_ago)).replace(microsecond=microsecond)
+    return [timestamp.isoformat(), str(rating), review, "response", "summary", "actions"]
+
+
+def reviews(df):
+    return sorted(df["user_review"])
+
+
+@pytest.fixture
+def archive_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_handler, "ARCHIVE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def use_sheet(monkeypatch):
+    def install(sheet):
+        monkeypatch.setattr(data_handler, "get_sheet", lambda: sheet)
+        return sheet
+    return install
+
+
+def test_archive_deletes_non_contiguous_rows(archive_dir, use_sheet):
+    sheet = use_sheet(FakeWorksheet([
+        submission(200, 5, "a"),
+        submission(150, 1, "b"),
+        submission(5, 3, "new-1"),
+        submission(120, 4, "c"),
+        submission(100, 2, "d"),
+        submission(1, 5, "new-2"),
+    ]))
+
+    assert data_handler.archive_old_submissions(90) == 4
+
+    # Rows 5-6 and 2-3 form two runs, deleted bottom-up
+    assert sheet.delete_calls == [(5, 6), (2, 3)]
+    assert [row[2] for row in sheet.values[1:]] == ["new-1", "new-2"]
+    assert reviews(data_handler.load_archived_submissions()) == ["a", "b", "c", "d"]
+
+
+def test_archive_failure_is_reported_and_rerun_does_not_duplicate(archive_dir, use_sheet, capsys):
+    rows = [
+        submission(200, 5, "a"),
+        submission(150, 1, "b"),
+        submission(5, 3, "new-1"),
+        submission(120, 4, "c"),
+        submission(100, 2, "d"),
+    ]
+    sheet = use_sheet(FakeWorksheet(rows, fail_on_delete_call=2))
+
+    with pytest.raises(RuntimeError):
+        data_handler.archive_old_submissions(90)
+    assert "Deleted 2 of 4" in capsys.readouterr().out
+    assert [row[2] for row in sheet.values[1:]] == ["a", "b", "new-1"]
+
+    # Rows already archived but still in the sheet are not duplicated when loading
+    start = (datetime.now() - timedelta(days=365)).date()
+    assert reviews(data_handler.load_all_submissions(start_date=start)) == ["a", "b", "c", "d", "new-1"]
+
+    sheet.fail_on_delete_call = None
+    assert data_handler.archive_old_submissions(90) == 2
+    assert [row[2] for row in sheet.values[1:]] == ["new-1"]
+    assert reviews(data_handler.load_all_submissions(start_date=start)) == ["a", "b", "c", "d", "new-1"]
+    assert len(list(archive_dir.rglob("*.parquet"))) == 4
+
+
+def test_archive_partitions_are_pruned_by_date_and_rating(archive_dir, use_sheet):
+    use_sheet(FakeWorksheet([
+        submission(200, 5, "a"),
+        submission(150, 1, "b"),
+        submission(120, 4, "c"),
+        submission(100, 2, "d"),
+    ]))
+    data_handler.archive_old_submissions(90)
+
+    now = datetime.now()
+    paths = data_handler._archive_partitions(
+        start_date=(now - timedelta(days=160)).date(),
+        end_date=(now - timedelta(days=110)).date(),
+        min_rating=3
+    )
+    assert len(paths) == 1
+    assert "user_rating=4" in paths[0]
+
+    # datetime bounds are accepted as well as dates
+    archived = data_handler.load_archived_submissions(
+        start_date=now - timedelta(days=160),
+        min_rating=2
+    )
+    assert reviews(archived) == ["c", "d"]
+
+
+def test_end_date_only_reads_archive(archive_dir, use_sheet):
+    sheet = use_sheet(FakeWorksheet([
+        submission(200, 5, "a"),
+        submission(120, 4, "b"),
+        submission(1, 5, "new"),
+    ]))
+    data_handler.archive_old_submissions(90)
+
+    end = (datetime.now() - timedelta(days=100)).date()
+    assert reviews(data_handler.load_all_submissions(end_date=end)) == ["a", "b"]
+
+    # Without bounds only the live sheet is read
+    assert reviews(data_handler.load_all_submissions()) == ["new"]
+    assert len(sheet.values) == 2
+
+
+def test_timestamps_without_fraction_are_archived_and_filtered(archive_dir, use_sheet):
+    use_sheet(FakeWorksheet([
+        submission(120, 4, "with-fraction"),
+        submission(110, 3, "no-fraction", microsecond=0),
+        submission(2, 5, "new", microsecond=0),
+    ]))
+
+    assert data_handler.archive_old_submissions(90) == 2
+
+    start = (datetime.now() - timedelta(days=365)).date()
+    assert reviews(data_handler.load_all_submissions(start_date=start)) == [
+        "new", "no-fraction", "with-fraction"
+    ]